@@ -46,10 +46,13 @@ class BatchNorm1dDerivatives(BaseParameterDerivatives):
 
         dx_hat = einsum("vni,i->vni", (mat, module.weight))
 
+        # accumulate in a single [V, N, I] buffer
         jac_t_mat = N * dx_hat
-        jac_t_mat -= dx_hat.sum(1).unsqueeze(1).expand_as(jac_t_mat)
-        jac_t_mat -= einsum("ni,vsi,si->vni", (x_hat, dx_hat, x_hat))
-        jac_t_mat = einsum("vni,i->vni", (jac_t_mat, ivar / N))
+        jac_t_mat -= dx_hat.sum(1, keepdim=True)
+        x_hat_t_dx_hat = einsum("vsi,si->vi", (dx_hat, x_hat))
+        jac_t_mat.addcmul_(x_hat, x_hat_t_dx_hat.unsqueeze(1), value=-1)
+
+        jac_t_mat.mul_(ivar / N)
 
         return jac_t_mat
 
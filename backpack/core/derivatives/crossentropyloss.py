@@ -75,17 +75,15 @@ class CrossEntropyLossDerivatives(BaseLossDerivatives):
         self._check_2nd_order_parameters(module)
 
         probs = self._get_probs(module)
+        scaled_probs = probs
+        if module.reduction == "mean":
+            N = module.input0.shape[0]
+            scaled_probs = probs / N
 
         def hessian_mat_prod(mat):
-            Hmat = einsum("bi,cbi->cbi", (probs, mat)) - einsum(
-                "bi,bj,cbj->cbi", (probs, probs, mat)
-            )
-
-            if module.reduction == "mean":
-                N = module.input0.shape[0]
-                Hmat /= N
-
-            return Hmat
+            # [diag(p) - p pᵀ] mat, contract pᵀ mat first
+            probs_t_mat = einsum("bj,cbj->cb", (probs, mat)).unsqueeze(-1)
+            return scaled_probs * (mat - probs_t_mat)
 
         return hessian_mat_prod
 
@@ -5,10 +5,8 @@ from backpack.core.derivatives.basederivatives import BaseDerivatives
 
 class ElementwiseDerivatives(BaseDerivatives):
     def _jac_t_mat_prod(self, module, g_inp, g_out, mat):
-        self._no_inplace(module)
-
-        df_elementwise = self.df(module, g_inp, g_out)
-        return einsum("...,v...->v...", (df_elementwise, mat))
+        df_elementwise = self.jac_diagonal(module, g_inp, g_out)
+        return df_elementwise * mat
 
     def _jac_mat_prod(self, module, g_inp, g_out, mat):
         self._no_inplace(module)
@@ -19,7 +17,16 @@ class ElementwiseDerivatives(BaseDerivatives):
         self._no_inplace(module)
 
         batch, df_flat = self.batch_flat(self.df(module, g_inp, g_out))
-        return einsum("ni,nj,ij->ij", (df_flat, df_flat, mat)) / batch
+        return einsum("ni,nj->ij", (df_flat, df_flat)) * mat / batch
+
+    def jac_diagonal(self, module, g_inp, g_out):
+        """Return the diagonal of the Jacobian, which has shape [N, *].
+
+        The Jacobian of an elementwise operation is diagonal and symmetric.
+        """
+        self._no_inplace(module)
+
+        return self.df(module, g_inp, g_out)
 
     def hessian_diagonal(self, module, g_inp, g_out):
         self._no_inplace(module)
@@ -95,11 +95,12 @@ class MSELossDerivatives(BaseLossDerivatives):
     def _make_hessian_mat_prod(self, module, g_inp, g_out):
         """Multiplication of the input Hessian with a matrix."""
 
+        scale = 2.0
+        if module.reduction == "mean":
+            scale /= module.input0.numel()
+
         def hessian_mat_prod(mat):
-            Hmat = 2 * mat
-            if module.reduction == "mean":
-                Hmat /= module.input0.numel()
-            return Hmat
+            return scale * mat
 
         return hessian_mat_prod
 
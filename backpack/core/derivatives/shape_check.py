@@ -22,20 +22,20 @@ def remove_V_dim(mat):
 
 def check_shape(mat, like, diff=1):
     """Compare dimension diff,diff+1, ... with dimension 0,1,..."""
-    mat_shape = [int(dim) for dim in mat.shape]
-    like_shape = [int(dim) for dim in like.shape]
+    # compare `torch.Size`s directly, this runs on every matrix product
+    mat_shape, like_shape = mat.shape, like.shape
 
-    if len(mat_shape) - len(like_shape) != diff:
+    if mat.dim() - like.dim() != diff:
         raise RuntimeError(
             "Difference in dimension must be {}.".format(diff),
-            " Got {} and {}".format(mat_shape, like_shape),
+            " Got {} and {}".format(list(mat_shape), list(like_shape)),
         )
     if mat_shape[diff:] != like_shape:
         raise RuntimeError(
             "Compared shapes {} and {} do not match. ".format(
-                mat_shape[diff:], like_shape
+                list(mat_shape[diff:]), list(like_shape)
             ),
-            "Got {} and {}".format(mat_shape, like_shape),
+            "Got {} and {}".format(list(mat_shape), list(like_shape)),
         )
 
 
@@ -55,7 +55,7 @@ def check_like_with_sum_batch(mat, module, name, sum_batch=True, *args, **kwargs
 
 
 def same_dim_as(mat, module, name, *args, **kwargs):
-    return len(mat.shape) == len(getattr(module, name).shape)
+    return mat.dim() == getattr(module, name).dim()
 
 
 ###############################################################################
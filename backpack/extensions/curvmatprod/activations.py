@@ -2,19 +2,19 @@ from backpack.core.derivatives.relu import ReLUDerivatives
 from backpack.core.derivatives.sigmoid import SigmoidDerivatives
 from backpack.core.derivatives.tanh import TanhDerivatives
 
-from .cmpbase import CMPBase
+from .elementwise import CMPElementwise
 
 
-class CMPReLU(CMPBase):
+class CMPReLU(CMPElementwise):
     def __init__(self):
         super().__init__(derivatives=ReLUDerivatives())
 
 
-class CMPSigmoid(CMPBase):
+class CMPSigmoid(CMPElementwise):
     def __init__(self):
         super().__init__(derivatives=SigmoidDerivatives())
 
 
-class CMPTanh(CMPBase):
+class CMPTanh(CMPElementwise):
     def __init__(self):
         super().__init__(derivatives=TanhDerivatives())
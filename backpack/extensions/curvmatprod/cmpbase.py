@@ -1,8 +1,9 @@
-from torch import einsum
+from torch import empty_like
 
 from backpack.core.derivatives.shape_check import (
-    R_mat_prod_accept_vectors,
-    R_mat_prod_check_shapes,
+    add_V_dim,
+    remove_V_dim,
+    same_dim_as,
 )
 from backpack.extensions.curvature import Curvature
 from backpack.extensions.module_extension import ModuleExtension
@@ -13,6 +14,10 @@ class CMPBase(ModuleExtension):
     Given matrix-vector product routine `MVP(A)` backpropagate to `MVP(J^T A J)`.
     """
 
+    # Number of columns multiplied at once. Intermediates in the chain below
+    # scale with this number instead of the total number of columns.
+    V_CHUNK_SIZE = 64
+
     def __init__(self, derivatives, params=None):
         super().__init__(params=params)
         self.derivatives = derivatives
@@ -24,9 +29,9 @@ class CMPBase(ModuleExtension):
         """
         GGN_mat_prod = self._make_GGN_mat_prod(ext, module, g_inp, g_out, backproped)
 
-        R_required = self._require_residual(ext, module, g_inp, g_out, backproped)
-        if R_required:
-            R_mat_prod = self._make_R_mat_prod(ext, module, g_inp, g_out, backproped)
+        CMP_mat_prod = self._make_CMP_mat_prod(
+            ext, module, g_inp, g_out, backproped, GGN_mat_prod
+        )
 
         def CMP_in(mat):
             """Multiplication with curvature matrix w.r.t. the module input.
@@ -36,12 +41,21 @@ class CMPBase(ModuleExtension):
             mat : torch.Tensor
                 Matrix that will be multiplied.
             """
-            out = GGN_mat_prod(mat)
-
-            if R_required:
-                out.add_(R_mat_prod(mat))
-
-            return out
+            # Add the vectorization axis once, such that the whole chain of
+            # products down to the loss runs batched over the columns
+            is_vec = same_dim_as(mat, module, "input0")
+            mat = mat if not is_vec else add_V_dim(mat)
+
+            V = mat.shape[0]
+            if V > self.V_CHUNK_SIZE:
+                out = empty_like(mat)
+                for start in range(0, V, self.V_CHUNK_SIZE):
+                    end = start + self.V_CHUNK_SIZE
+                    out[start:end] = CMP_mat_prod(mat[start:end])
+            else:
+                out = CMP_mat_prod(mat)
+
+            return out if not is_vec else remove_V_dim(out)
 
         return CMP_in
 
@@ -62,44 +76,51 @@ class CMPBase(ModuleExtension):
 
         return GGN_mat_prod
 
-    def _require_residual(self, ext, module, g_inp, g_out, backproped):
-        """Is the residual term required for multiply with the curvature?"""
-        vanishes = self.derivatives.hessian_is_zero()
-        neglected = not Curvature.require_residual(ext.get_curv_type())
+    def _make_CMP_mat_prod(self, ext, module, g_inp, g_out, backproped, GGN_mat_prod):
+        """Return multiplication routine with the curvature w.r.t. the module input.
 
-        return not (vanishes or neglected)
+        The residual term is resolved here, such that the returned routine does
+        not branch on every call. Matrices must have shape [V, N, *].
+        """
+        R_required = self._require_residual(ext, module, g_inp, g_out, backproped)
+
+        if not R_required:
+            return GGN_mat_prod
 
-    def _make_R_mat_prod(self, ext, module, g_inp, g_out, backproped):
-        """Return multiplication routine with the second HBP term."""
         if self.derivatives.hessian_is_diagonal():
-            R_mat_prod = self.__make_diagonal_R_mat_prod(
-                ext, module, g_inp, g_out, backproped
-            )
+            R_mod = self.__make_diagonal_residual(ext, module, g_inp, g_out)
+
+            def CMP_mat_prod(mat):
+                # broadcasting R_mod [N, *] against mat [V, N, *] avoids an
+                # intermediate for the residual term
+                return GGN_mat_prod(mat).addcmul_(R_mod, mat)
+
         else:
             R_mat_prod = self.__make_nondiagonal_R_mat_prod(
                 ext, module, g_inp, g_out, backproped
             )
 
-        return R_mat_prod
+            def CMP_mat_prod(mat):
+                return GGN_mat_prod(mat).add_(R_mat_prod(mat))
 
-    def __make_diagonal_R_mat_prod(self, ext, module, g_inp, g_out, backproped):
-        # TODO Refactor core: hessian_diagonal -> residual_diagonal
-        R = self.derivatives.hessian_diagonal(module, g_inp, g_out)
-        R_mod = Curvature.modify_residual(R, ext.get_curv_type())
+        return CMP_mat_prod
 
-        @R_mat_prod_accept_vectors
-        @R_mat_prod_check_shapes
-        def make_residual_mat_prod(self, module, g_inp, g_out):
-            def R_mat_prod(mat):
-                """Multiply with the residual: mat → [∑_{k} Hz_k(x) 𝛿z_k] mat.
+    def _require_residual(self, ext, module, g_inp, g_out, backproped):
+        """Is the residual term required for multiply with the curvature?"""
+        if self.derivatives.hessian_is_zero():
+            return False
 
-                Second term of the module input Hessian backpropagation equation.
-                """
-                return einsum("n...,vn...->vn...", (R_mod, mat))
+        return Curvature.require_residual(ext.get_curv_type())
 
-            return R_mat_prod
+    def __make_diagonal_residual(self, ext, module, g_inp, g_out):
+        """Return the modified diagonal residual of shape [N, *].
 
-        return make_residual_mat_prod(self, module, g_inp, g_out)
+        Multiplication with the residual, mat → [∑_{k} Hz_k(x) 𝛿z_k] mat, is
+        an elementwise scaling of each slice along the vectorization axis.
+        """
+        # TODO Refactor core: hessian_diagonal -> residual_diagonal
+        R = self.derivatives.hessian_diagonal(module, g_inp, g_out)
+        return Curvature.modify_residual(R, ext.get_curv_type())
 
     def __make_nondiagonal_R_mat_prod(self, ext, module, g_inp, g_out, backproped):
         curv_type = ext.get_curv_type()
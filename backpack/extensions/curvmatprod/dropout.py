@@ -1,8 +1,8 @@
 from backpack.core.derivatives.dropout import DropoutDerivatives
 
-from .cmpbase import CMPBase
+from .elementwise import CMPElementwise
 
 
-class CMPDropout(CMPBase):
+class CMPDropout(CMPElementwise):
     def __init__(self):
         super().__init__(derivatives=DropoutDerivatives())
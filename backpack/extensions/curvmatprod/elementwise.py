@@ -0,0 +1,31 @@
+from backpack.core.derivatives.shape_check import check_like
+from backpack.extensions.curvmatprod.cmpbase import CMPBase
+
+
+class CMPElementwise(CMPBase):
+    """CMP for modules with elementwise derivatives (activations, dropout)."""
+
+    def _make_GGN_mat_prod(self, ext, module, g_inp, g_out, backproped):
+        """Return multiplication routine with the first HBP term.
+
+        The Jacobian of an elementwise operation is diagonal. Its diagonal is
+        evaluated on the first multiplication and reused afterwards, instead of
+        twice for every multiplication. Matrices must have shape [V, N, *].
+        """
+        CMP_out = backproped
+        df_cache = []
+
+        def GGN_mat_prod(mat):
+            """Multiply with the GGN term: mat → [𝒟z(x)ᵀ ℋz 𝒟z(x)] mat.
+
+            First term of the module input Hessian backpropagation equation.
+            """
+            check_like(mat, module, "input0")
+
+            if not df_cache:
+                df_cache.append(self.derivatives.jac_diagonal(module, g_inp, g_out))
+            df = df_cache[0]
+
+            return df * CMP_out(df * mat)
+
+        return GGN_mat_prod
@@ -13,11 +13,10 @@ class MatToJacMat(ModuleExtension):
     def backpropagate(self, ext, module, grad_inp, grad_out, backproped):
 
         if isinstance(backproped, list):
-            M_list = [
+            return [
                 self.derivatives.jac_t_mat_prod(module, grad_inp, grad_out, M)
                 for M in backproped
             ]
-            return list(M_list)
         else:
             return self.derivatives.jac_t_mat_prod(
                 module, grad_inp, grad_out, backproped
@@ -20,9 +20,12 @@ def load_mnist_dataset():
 
 
 def get_mnist_dataloder(batch_size=64, shuffle=True):
-    """Returns a dataloader for MNIST"""
+    """Returns a dataloader for MNIST, pinned if CUDA is available"""
     return torch.utils.data.dataloader.DataLoader(
-        load_mnist_dataset(), batch_size=batch_size, shuffle=shuffle,
+        load_mnist_dataset(),
+        batch_size=batch_size,
+        shuffle=shuffle,
+        pin_memory=torch.cuda.is_available(),
     )
 
 
@@ -116,7 +116,7 @@ optimizer = DiagGGNOptimizer(model.parameters(), step_size=STEP_SIZE, damping=DA
 losses = []
 accuracies = []
 for batch_idx, (x, y) in enumerate(mnist_loader):
-    x, y = x.to(DEVICE), y.to(DEVICE)
+    x, y = x.to(DEVICE, non_blocking=True), y.to(DEVICE, non_blocking=True)
     outputs = model(x)
     loss = loss_function(outputs, y)
 
@@ -246,7 +246,7 @@ losses = []
 accuracies = []
 for epoch in range(NUM_EPOCHS):
     for batch_idx, (x, y) in enumerate(mnist_dataloader):
-        x, y = x.to(DEVICE), y.to(DEVICE)
+        x, y = x.to(DEVICE, non_blocking=True), y.to(DEVICE, non_blocking=True)
 
         model.zero_grad()
 
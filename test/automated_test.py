@@ -2,6 +2,8 @@ import numpy as np
 import pytest
 import torch
 
+from backpack.extensions.curvmatprod.cmpbase import CMPBase
+
 from .implementation.implementation_autograd import AutogradImpl
 from .implementation.implementation_bpext import BpextImpl
 from .test_problems_activations import TEST_PROBLEMS as ACT_TEST_PROBLEMS
@@ -34,6 +36,11 @@ for dev_name, dev in DEVICES.items():
         ALL_CONFIGURATIONS.append((prob, dev))
         CONFIGURATION_IDS.append(probname + "-" + dev_name)
 
+# multiply with the curvature in one go, or in chunks of fewer columns than
+# the matrices used below have
+CHUNK_SIZES = [CMPBase.V_CHUNK_SIZE, 3]
+CHUNK_IDS = ["chunk={}".format(size) for size in CHUNK_SIZES]
+
 atol = 1e-5
 rtol = 1e-5
 
@@ -175,8 +182,10 @@ def test_diag_h(problem, device):
     check_values(autograd_res, backpack_res)
 
 
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES, ids=CHUNK_IDS)
 @pytest.mark.parametrize("problem,device", ALL_CONFIGURATIONS, ids=CONFIGURATION_IDS)
-def test_hmp(problem, device):
+def test_hmp(problem, device, chunk_size, monkeypatch):
+    monkeypatch.setattr(CMPBase, "V_CHUNK_SIZE", chunk_size)
     problem.to(device)
 
     NUM_COLS = 10
@@ -0,0 +1,50 @@
+"""Test backpropagation of matrix lists in `MatToJacMat`.
+
+A list of matrices must give the same result as applying the transposed
+Jacobian to each list entry separately.
+"""
+import pytest
+import torch
+from torch.nn import Conv2d, Linear, MaxPool2d, Sigmoid
+
+from backpack import extend
+from backpack.core.derivatives import derivatives_for
+from backpack.extensions.mat_to_mat_jac_base import MatToJacMat
+
+from .automated_test import check_sizes, check_values
+
+
+def make_id(layer, input_shape):
+    return "in{}-{}".format(input_shape, layer)
+
+
+ARGS = "layer,input_shape"
+SETTINGS = [
+    # (layer, input_shape)
+    [Linear(20, 10), (5, 20)],
+    [Sigmoid(), (6, 2, 7)],
+    [MaxPool2d(kernel_size=2), (5, 3, 10, 8)],
+    [Conv2d(2, 3, kernel_size=2, padding=1, stride=2), (3, 2, 11, 13)],
+]
+IDS = [make_id(layer, input_shape) for (layer, input_shape) in SETTINGS]
+
+
+@pytest.mark.parametrize(ARGS, SETTINGS, ids=IDS)
+def test_mat_to_jac_mat_list(layer, input_shape):
+    torch.manual_seed(0)
+    layer = extend(layer)
+    derivative = derivatives_for[layer.__class__]()
+
+    input = torch.rand(input_shape)
+    output = layer(input)
+
+    # list entries may differ in the number of vectors
+    V_list = [1, 4, 3]
+    mat_list = [torch.rand(V, *output.shape) for V in V_list]
+
+    result = MatToJacMat(derivative).backpropagate(None, layer, None, None, mat_list)
+    expected = [derivative.jac_t_mat_prod(layer, None, None, M) for M in mat_list]
+
+    assert isinstance(result, list)
+    check_sizes(result, expected)
+    check_values(result, expected)